@@ -8,40 +8,64 @@ Scrape Nom/Région/Email/Groupe/Circonscription pour des député·e·s
 de l'Assemblée nationale française, avec retries, gestion de délai,
 timeout, multithreading et tableau ASCII optionnel.
 
+Les données proviennent de l'archive open data de l'Assemblée (une seule
+requête, JSON) ; le scraping des pages HTML sert de repli si elle est
+indisponible.
+
+Dépendances:
+  pip install requests requests-cache beautifulsoup4 lxml
+
 Usage:
   python3 scrape_deputes_france.py [--threads X --output path --debug
                                    --retries R --delay D --timeout T
                                    --fields "nom,email" --table
-                                   --barefields --no-separator]
+                                   --barefields --no-separator --refresh]
 
 Examples:
-  1) Par défaut (affiche tout, séquentiel, pas de tableau):
+  1) Par défaut (affiche tout, multithreading, pas de tableau):
      python3 scrape_deputes_france.py
 
   2) Nom + email, sans labels ("barefields"):
      python3 scrape_deputes_france.py --fields nom,email --barefields
 
-  3) Tout afficher + tableau final, multithreading (5 threads):
-     python3 scrape_deputes_france.py --threads 5 --table
+  3) Tout afficher + tableau final, séquentiel (1 thread):
+     python3 scrape_deputes_france.py --threads 1 --table
 
-  4) 5 tentatives, 2 s de délai entre chaque, 15 s de timeout:
+  4) 5 tentatives, délai de base 2 s (backoff exponentiel), 15 s de timeout:
      python3 scrape_deputes_france.py --retries 5 --delay 2 --timeout 15
 
   5) N'afficher que l'email (barefields) sans "----------------------------------------":
      python3 scrape_deputes_france.py --fields email --barefields --no-separator
+
+  6) Vider le cache local et retélécharger toutes les pages:
+     python3 scrape_deputes_france.py --refresh
 """
 
 import argparse
 import concurrent.futures
+import io
+import json
+import os
+import random
 import re
 import time
-from typing import Dict, List, Optional
+import unicodedata
+import zipfile
+from typing import Any, Dict, List, Optional
 
 import requests
+import requests_cache
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 BASE_URL: str = "https://www.assemblee-nationale.fr"
 DEPUTES_URL: str = "https://www2.assemblee-nationale.fr/deputes/liste/regions"
+# Open data : député·e·s en exercice, mandats et organes (archive ZIP de JSON)
+OPENDATA_URL: str = (
+    "https://data.assemblee-nationale.fr/static/openData/repository/17/amo/"
+    "deputes_actifs_mandats_actifs_organes/"
+    "AMO10_deputes_actifs_mandats_actifs_organes.json.zip"
+)
 
 # Exemple de « régions » structurées en <h2> sur la page
 TOP_REGIONS: List[str] = [
@@ -49,6 +73,56 @@ TOP_REGIONS: List[str] = [
     "Provence-Alpes-Côte d'Azur",
 ]
 
+# Travail I/O-bound => plus de threads que de cœurs
+DEFAULT_THREADS: int = min(16, (os.cpu_count() or 1) * 4)
+
+# Plafond (s) du backoff exponentiel entre deux tentatives
+MAX_BACKOFF: float = 60.0
+
+# Ligne de séparation entre deux député·e·s
+SEP_LINE: str = "-" * 40
+
+# Regex compilées une seule fois (appelées pour chaque député)
+_OMC_ID_RE = re.compile(r"/deputes/fiche/OMC_PA(\d+)")
+_MAILTO_RE = re.compile(r"^mailto:")
+
+# Session partagée : keep-alive => une seule poignée de main TCP/TLS par connexion.
+# Les réponses sont mises en cache sur disque (SQLite, dans le répertoire
+# de cache de l'utilisateur, ex. ~/.cache/deputes.sqlite) pendant 24 h et
+# revalidées via ETag/Last-Modified lorsque le serveur les fournit.
+# Créée à la demande par configure_session (pas de fichier à l'import).
+SESSION: Optional[requests_cache.CachedSession] = None
+
+
+def configure_session(pool_size: int, refresh: bool = False) -> None:
+    """
+    Crée SESSION si besoin et y monte un HTTPAdapter dont le pool de
+    connexions est dimensionné pour 'pool_size' threads concurrents.
+    Les retries sont gérés par get_with_retries (max_retries=0 ici).
+    Si refresh, vide le cache local : toutes les pages sont retéléchargées.
+    """
+    global SESSION
+    if SESSION is None:
+        SESSION = requests_cache.CachedSession(
+            cache_name="deputes",
+            backend="sqlite",
+            use_cache_dir=True,
+            expire_after=86400,
+        )
+        SESSION.headers.update({
+            "User-Agent": "Mozilla/5.0 (compatible; scrape-deputes-france)",
+            "Accept-Encoding": "gzip, deflate",
+        })
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=0
+    )
+    SESSION.mount("http://", adapter)
+    SESSION.mount("https://", adapter)
+    if refresh:
+        SESSION.cache.clear()
+
 
 def get_with_retries(
     url: str,
@@ -59,91 +133,311 @@ def get_with_retries(
 ) -> Optional[requests.Response]:
     """
     Effectue plusieurs tentatives (max_retries) de requête GET sur 'url'.
-    Attends delay_between secondes entre chaque tentative si la précédente
-    a échoué. Le timeout de la requête est fixé par 'timeout'.
+    Entre deux tentatives, attend delay_between * 2^(tentative-1) secondes
+    (plafonné à MAX_BACKOFF, avec jitter ±50 %). Sur 429/503, l'en-tête
+    Retry-After du serveur est respecté tel quel (sans plafond) s'il est plus long.
+    Le timeout de la requête est fixé par 'timeout'.
     Retourne un objet Response si succès, sinon None.
     """
+    if SESSION is None:
+        configure_session(1)
     for attempt in range(1, max_retries + 1):
         try:
             if debug:
                 print(f"[DEBUG] Attempt {attempt}/{max_retries} fetching: {url}")
-            resp = requests.get(url, timeout=timeout)
+            resp = SESSION.get(url, timeout=timeout)
             resp.raise_for_status()
             return resp
         except requests.RequestException as exc:
             print(f"[ERROR] Attempt {attempt} failed for {url}: {exc}")
-            if attempt < max_retries and delay_between > 0:
+            if attempt >= max_retries:
+                break
+            wait = 0.0
+            if delay_between > 0:
+                backoff = min(MAX_BACKOFF, delay_between * 2 ** (attempt - 1))
+                wait = backoff * random.uniform(0.5, 1.5)
+            if exc.response is not None and exc.response.status_code in (429, 503):
+                retry_after = exc.response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    # Valeur imposée par le serveur : jamais raccourcie
+                    wait = max(wait, float(retry_after))
+            if wait > 0:
                 if debug:
-                    print(f"[DEBUG] Sleeping {delay_between}s before retrying...")
-                time.sleep(delay_between)
+                    print(f"[DEBUG] Sleeping {wait:.2f}s before retrying...")
+                time.sleep(wait)
     # Echec complet
     return None
 
 
-def get_deputes_from_region(
-    region_name: str,
+def _as_list(value: Any) -> List[Any]:
+    """
+    Les JSON de l'open data représentent une liste à un élément par l'élément
+    seul, et une liste vide par null : on normalise toujours en liste.
+    """
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _region_key(region: str) -> str:
+    """
+    Clé de comparaison insensible à la casse et aux accents
+    ("Île-de-France" de l'open data == "Ile-de-France" du site).
+    """
+    decomposed = unicodedata.normalize("NFKD", region)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def _is_nil(value: Any) -> bool:
+    """
+    Les dumps JSON (convertis depuis le XML) encodent un champ vide soit
+    par null, soit par {"@xsi:nil": "true"} : les deux sont traités pareil.
+    """
+    return value is None or (isinstance(value, dict) and "@xsi:nil" in value)
+
+
+def _scalar(value: Any) -> Optional[str]:
+    """
+    Valeur texte d'un champ de l'open data, None si le champ est vide
+    (null, {"@xsi:nil": ...}) ou n'a pas la forme attendue.
+    """
+    return value if isinstance(value, str) and not _is_nil(value) else None
+
+
+def _field(obj: Any, *keys: str) -> Any:
+    """
+    Descend dans les dictionnaires imbriqués de l'open data en suivant 'keys'.
+    Retourne None dès qu'un niveau manque ou n'est pas un dictionnaire,
+    au lieu de lever une exception sur une structure inattendue.
+    """
+    for key in keys:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def _records(value: Any) -> List[Dict[str, Any]]:
+    """
+    _as_list restreint aux dictionnaires (mandats, adresses...).
+    """
+    return [item for item in _as_list(value) if isinstance(item, dict)]
+
+
+def _opendata_depute(
+    acteur: Dict[str, Any],
+    wanted: Dict[str, str],
+    groups: Dict[str, Optional[str]]
+) -> Optional[tuple]:
+    """
+    Extrait ((nom, prénom), député·e) d'un acteur de l'open data,
+    ou None s'il n'a pas de mandat de député·e en cours dans 'wanted'.
+    """
+    mandats = _records(_field(acteur, "mandats", "mandat"))
+    # Mandat de député·e en cours => région + circonscription
+    mandat_an = next(
+        (m for m in mandats
+         if m.get("typeOrgane") == "ASSEMBLEE" and _is_nil(m.get("dateFin"))),
+        None
+    )
+    if not mandat_an:
+        return None
+    lieu = _field(mandat_an, "election", "lieu")
+    region = wanted.get(_region_key(_scalar(_field(lieu, "region")) or ""))
+    if not region:
+        return None
+
+    ident = _field(acteur, "etatCivil", "ident")
+    civ = _scalar(_field(ident, "civ"))
+    prenom = _scalar(_field(ident, "prenom"))
+    nom = _scalar(_field(ident, "nom"))
+    name = " ".join(part for part in (civ, prenom, nom) if part)
+
+    email = None
+    for adresse in _records(_field(acteur, "adresses", "adresse")):
+        val = _scalar(adresse.get("valElec")) or ""
+        if adresse.get("typeLibelle") == "Mèl et site internet" and "@" in val:
+            email = val
+            break
+
+    group = None
+    for mandat in mandats:
+        if mandat.get("typeOrgane") == "GP" and _is_nil(mandat.get("dateFin")):
+            group = groups.get(_scalar(_field(mandat, "organes", "organeRef")))
+            break
+
+    # Ordinaux français standard : 1re, 2e, 3e...
+    circonscription = None
+    num_circo = _scalar(_field(lieu, "numCirco"))
+    if num_circo:
+        ordinal = "1re" if num_circo == "1" else f"{num_circo}e"
+        departement = _scalar(_field(lieu, "departement"))
+        circonscription = f"{ordinal} circonscription"
+        if departement:
+            circonscription = f"{departement} ({circonscription})"
+
+    return ((nom or "", prenom or ""), {
+        "nom": name,
+        "region": region,
+        "email": email,
+        "groupe": group,
+        "circonscription": circonscription,
+    })
+
+
+def get_opendata_deputies(
+    regions: List[str],
     max_retries: int,
     delay_between: float,
     timeout: float,
     debug: bool = False
-) -> Dict[str, str]:
+) -> Optional[List[Dict[str, Optional[str]]]]:
     """
-    Récupère (nom -> URL) pour tous les député·e·s figurant
-    dans la région h2=region_name (page DEPUTES_URL).
-    Le site est structuré en <h2>region_name</h2>, <h4 departementTitre>, <li>...
+    Récupère Nom, Région, Email, Groupe, Circonscription de tous les
+    député·e·s des régions demandées via l'archive open data OPENDATA_URL.
+    Une seule requête, aucun parsing HTML : l'archive contient un JSON par
+    acteur (json/acteur/PA*.json) et par organe (json/organe/PO*.json).
+    Retourne None si l'archive est indisponible ou illisible.
     """
     if debug:
-        print(f"[DEBUG] Collecting deputies for region: {region_name}")
+        print(f"[DEBUG] Fetching open data archive: {OPENDATA_URL}")
 
     resp = get_with_retries(
-        DEPUTES_URL,
+        OPENDATA_URL,
         max_retries=max_retries,
         delay_between=delay_between,
         timeout=timeout,
         debug=debug
     )
     if not resp:
-        print(f"[ERROR] Could not fetch region page: {DEPUTES_URL}")
-        return {}
+        print(f"[ERROR] Could not fetch open data archive: {OPENDATA_URL}")
+        return None
+
+    wanted: Dict[str, str] = {_region_key(r): r for r in regions}
+    groups: Dict[str, Optional[str]] = {}
+    keyed: List[tuple] = []
+
+    # Seules la décompression et le décodage JSON sont protégés : la structure
+    # est validée explicitement par _field/_records/_scalar, sans masquer
+    # d'éventuelles erreurs de programmation.
+    acteurs: List[Any] = []
+    try:
+        with zipfile.ZipFile(io.BytesIO(resp.content)) as archive:
+            for entry in archive.namelist():
+                if not entry.endswith(".json"):
+                    continue
+                with archive.open(entry) as json_file:
+                    data = json.load(json_file)
+                organe = _field(data, "organe")
+                if _scalar(_field(organe, "codeType")) == "GP":
+                    groups[_scalar(organe.get("uid"))] = _scalar(organe.get("libelle"))
+                acteur = _field(data, "acteur")
+                if isinstance(acteur, dict):
+                    acteurs.append(acteur)
+    except (zipfile.BadZipFile, ValueError) as exc:
+        print(f"[ERROR] Could not read open data archive: {exc}")
+        return None
+
+    for acteur in acteurs:
+        item = _opendata_depute(acteur, wanted, groups)
+        if item:
+            keyed.append(item)
+
+    # Une région sans aucun député·e => probablement un libellé qui ne correspond pas
+    found_regions = {dep["region"] for _, dep in keyed}
+    for region in regions:
+        if region not in found_regions:
+            print(f"[WARNING] No deputies found in open data for region {region}.")
+
+    # Un champ vide pour tous les député·e·s => structure de l'open data modifiée ?
+    if keyed:
+        for field in ("email", "groupe", "circonscription"):
+            if all(dep[field] is None for _, dep in keyed):
+                print(f"[WARNING] Field '{field}' is empty for every deputy in open data.")
+
+    # Tri par région (ordre de TOP_REGIONS) puis par nom
+    region_order = {region: i for i, region in enumerate(regions)}
+    keyed.sort(key=lambda item: (region_order[item[1]["region"]], item[0]))
+    if debug:
+        for _, dep in keyed:
+            print(f"[DEBUG] Email for {dep['nom']} => {dep['email']}")
+    return [dep for _, dep in keyed]
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    region_h2 = None
 
-    # Trouver la balise <h2> correspondant à region_name
-    for h2_tag in soup.find_all("h2"):
-        if h2_tag.get_text(strip=True) == region_name:
-            region_h2 = h2_tag
-            break
+def get_all_regions_deputies(
+    regions: List[str],
+    max_retries: int,
+    delay_between: float,
+    timeout: float,
+    debug: bool = False
+) -> Dict[str, Dict[str, str]]:
+    """
+    Récupère (région -> (nom -> URL)) pour toutes les régions demandées.
+    La page DEPUTES_URL n'est téléchargée et parsée qu'une seule fois.
+    Le site est structuré en <h2>region_name</h2>, <h4 departementTitre>, <div><li>...
+    """
+    if debug:
+        print(f"[DEBUG] Collecting deputies for regions: {regions}")
 
-    if not region_h2:
-        if debug:
-            print(f"[WARNING] No <h2> found for region {region_name}.")
+    resp = get_with_retries(
+        DEPUTES_URL,
+        max_retries=max_retries,
+        delay_between=delay_between,
+        timeout=timeout,
+        debug=debug
+    )
+    if not resp:
+        print(f"[ERROR] Could not fetch region page: {DEPUTES_URL}")
         return {}
 
-    deputes_map: Dict[str, str] = {}
+    soup = BeautifulSoup(resp.content, "lxml")
+    wanted = set(regions)
+    regions_map: Dict[str, Dict[str, str]] = {}
 
-    # Parcourir les siblings après le <h2> pour trouver <h4 class='departementTitre'>, <li>, ...
-    for sibling in region_h2.next_siblings:
-        if sibling.name == "h2":
-            # Nouvelle région => on arrête
-            break
-        if sibling.name == "h4" and sibling.get("class") == ["departementTitre"]:
-            # Ensuite, on cherche <li>
-            for sub_sib in sibling.next_siblings:
-                if sub_sib.name in ("h4", "h2"):
-                    break
-                if sub_sib.name == "div":
-                    li_tags = sub_sib.find_all("li")
-                    for li_tag in li_tags:
-                        a_tag = li_tag.find("a", href=True)
-                        if a_tag and a_tag["href"].startswith("/deputes/fiche/"):
-                            name = a_tag.get_text(strip=True)
-                            full_url = BASE_URL + a_tag["href"]
-                            deputes_map[name] = full_url
+    # Un seul passage linéaire sur les <h2>, <h4> et <a>, avec la même portée
+    # que la structure du site : <h2>region</h2>, puis des <h4 departementTitre>
+    # frères du <h2>, chacun suivi de <div> frères contenant les <li>.
+    # Les liens hors de ces <div> (pied de page, barre latérale...) sont ignorés.
+    current_region: Optional[str] = None
+    region_h2 = None
+    departement_h4 = None
+    for tag in soup.find_all(["h2", "h4", "a"]):
+        if tag.name == "h2":
+            current_region = tag.get_text(strip=True)
+            region_h2 = tag
+            departement_h4 = None
+            if current_region not in wanted:
+                current_region = None
+            elif current_region not in regions_map:
+                regions_map[current_region] = {}
+            continue
+        if current_region is None:
+            continue
+        if tag.name == "h4":
+            if tag.parent is region_h2.parent:
+                is_departement = tag.get("class") == ["departementTitre"]
+                departement_h4 = tag if is_departement else None
+            continue
+        if departement_h4 is None:
+            continue
+        href = tag.get("href", "")
+        if not href.startswith("/deputes/fiche/") or tag.find_parent("li") is None:
+            continue
+        # Le lien doit être dans un <div> frère du <h4> de département courant
+        if any(parent.name == "div" and parent.parent is departement_h4.parent
+               for parent in tag.parents):
+            regions_map[current_region][tag.get_text(strip=True)] = BASE_URL + href
 
     if debug:
-        print(f"[DEBUG] Deputies found for {region_name}: {list(deputes_map.keys())}")
-    return deputes_map
+        for region_name in regions:
+            if region_name not in regions_map:
+                print(f"[WARNING] No <h2> found for region {region_name}.")
+            else:
+                names = list(regions_map[region_name].keys())
+                print(f"[DEBUG] Deputies found for {region_name}: {names}")
+    return regions_map
 
 
 def get_depute_info(
@@ -161,7 +455,7 @@ def get_depute_info(
     Parse l'email (mailto:), le groupe (a.h4._colored.link), la circonscription...
     """
     # Extraire l'ID OMC_PAxxxxxx
-    match_id = re.search(r"/deputes/fiche/OMC_PA(\d+)", url)
+    match_id = _OMC_ID_RE.search(url)
     if not match_id:
         if debug:
             print(f"[WARNING] Can't extract OMC_PA ID from {url}")
@@ -189,10 +483,10 @@ def get_depute_info(
             "circonscription": None,
         }
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.content, "lxml")
 
     # Email
-    a_mail = soup.find("a", href=re.compile(r"^mailto:"))
+    a_mail = soup.find("a", href=_MAILTO_RE)
     email = a_mail["href"].replace("mailto:", "") if a_mail else None
     if debug:
         print(f"[DEBUG] Email for {name} => {email}")
@@ -231,62 +525,48 @@ def build_ascii_table(
     header = [field.capitalize() for field in fields]
     rows = [header]
 
-    # Ajoute les données
+    # Ajoute les données (stringifiées une seule fois)
     for dep in results:
-        row = [dep.get(f, "") or "" for f in fields]
+        row = [str(dep.get(f, "") or "") for f in fields]
         rows.append(row)
 
-    # Largeur max pour chaque colonne
-    col_widths: List[int] = []
-    for c in range(len(fields)):
-        col_widths.append(
-            max(len(str(rows[r][c])) for r in range(len(rows)))
-        )
+    # Largeur max pour chaque colonne (transposition via zip)
+    col_widths: List[int] = [max(map(len, col)) for col in zip(*rows)]
 
     # Construction du tableau
-    lines: List[str] = []
-    for i, row in enumerate(rows):
-        cells = [str(cell).ljust(col_widths[c]) for c, cell in enumerate(row)]
-        line = " | ".join(cells)
-        lines.append(line)
-        if i == 0:
-            sep = "-+-".join("-" * w for w in col_widths)
-            lines.append(sep)
+    lines: List[str] = [
+        " | ".join(cell.ljust(w) for cell, w in zip(row, col_widths))
+        for row in rows
+    ]
+    lines.insert(1, "-+-".join("-" * w for w in col_widths))
 
     return "\n".join(lines)
 
 
-def scrape_deputes(
-    multithreading: bool = False,
-    max_threads: int = 5,
-    output_file: Optional[str] = None,
-    debug: bool = False,
-    retries: int = 3,
-    delay: float = 0.0,
-    req_timeout: float = 10.0,
-    fields: Optional[List[str]] = None,
-    use_table: bool = False,
-    barefields: bool = False,
-    no_separator: bool = False,
-) -> None:
+def scrape_deputes_html(
+    multithreading: bool,
+    max_threads: int,
+    retries: int,
+    delay: float,
+    req_timeout: float,
+    debug: bool = False
+) -> List[Dict[str, Optional[str]]]:
     """
-    Scrape Nom, Région, Email, Groupe, Circonscription pour les régions.
-    Si --barefields + 1 champ + --no-separator => pas de ligne de tirets.
+    Scrape Nom, Région, Email, Groupe, Circonscription depuis les pages HTML
+    du site (liste des régions, puis une fiche par député·e).
+    Utilisé en repli lorsque l'archive open data est indisponible.
     """
-    if fields is None:
-        fields = ["nom", "region", "email", "groupe", "circonscription"]
-
     # 1) Collecte
     deputes_data: List[tuple] = []
+    regions_map = get_all_regions_deputies(
+        TOP_REGIONS,
+        max_retries=retries,
+        delay_between=delay,
+        timeout=req_timeout,
+        debug=debug
+    )
     for region in TOP_REGIONS:
-        region_map = get_deputes_from_region(
-            region,
-            max_retries=retries,
-            delay_between=delay,
-            timeout=req_timeout,
-            debug=debug
-        )
-        for dep_name, dep_url in region_map.items():
+        for dep_name, dep_url in regions_map.get(region, {}).items():
             deputes_data.append((dep_name, dep_url, region))
 
     if debug:
@@ -297,22 +577,16 @@ def scrape_deputes(
     if multithreading:
         if debug:
             print(f"[DEBUG] Using multithreading with {max_threads} workers.")
+        # executor.map : pas de dictionnaire de futures, et l'ordre
+        # des député·e·s est conservé dans les résultats
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
-            future_map = {
-                executor.submit(
-                    get_depute_info,
-                    dep_name,
-                    dep_url,
-                    dep_region,
-                    retries,
-                    delay,
-                    req_timeout,
-                    debug
-                ): (dep_name, dep_url, dep_region)
-                for (dep_name, dep_url, dep_region) in deputes_data
-            }
-            for future in concurrent.futures.as_completed(future_map):
-                results.append(future.result())
+            results.extend(executor.map(
+                lambda dep: get_depute_info(
+                    dep[0], dep[1], dep[2],
+                    retries, delay, req_timeout, debug
+                ),
+                deputes_data
+            ))
     else:
         if debug:
             print("[DEBUG] Running sequentially.")
@@ -323,6 +597,48 @@ def scrape_deputes(
             )
             results.append(info)
 
+    return results
+
+
+def scrape_deputes(
+    multithreading: bool = False,
+    max_threads: int = 5,
+    output_file: Optional[str] = None,
+    debug: bool = False,
+    retries: int = 3,
+    delay: float = 0.0,
+    req_timeout: float = 10.0,
+    fields: Optional[List[str]] = None,
+    use_table: bool = False,
+    barefields: bool = False,
+    no_separator: bool = False,
+    refresh: bool = False,
+) -> None:
+    """
+    Scrape Nom, Région, Email, Groupe, Circonscription pour les régions.
+    Si --barefields + 1 champ + --no-separator => pas de ligne de tirets.
+    """
+    if fields is None:
+        fields = ["nom", "region", "email", "groupe", "circonscription"]
+
+    configure_session(max(1, max_threads), refresh)
+
+    # 1) Open data : une seule archive JSON, sans parsing HTML
+    results = get_opendata_deputies(
+        TOP_REGIONS,
+        max_retries=retries,
+        delay_between=delay,
+        timeout=req_timeout,
+        debug=debug
+    )
+    # 2) Repli sur le scraping HTML si l'open data est indisponible
+    if not results:
+        if debug:
+            print("[DEBUG] Open data unavailable, falling back to HTML scraping.")
+        results = scrape_deputes_html(
+            multithreading, max_threads, retries, delay, req_timeout, debug
+        )
+
     # 3) Format
     lines: List[str] = []
     # Condition : 1 seul champ, barefields, no_separator => pas de lignes de tirets
@@ -338,7 +654,7 @@ def scrape_deputes(
             else:
                 lines.append(f"{field.capitalize()}: {val}")
         if not skip_separators:
-            lines.append("-" * 40)
+            lines.append(SEP_LINE)
 
     # 4) Tableau si besoin
     ascii_table: str = ""
@@ -347,16 +663,18 @@ def scrape_deputes(
         ascii_table += build_ascii_table(results, fields)
         ascii_table += "\n"
 
-    final_output: str = "\n".join(lines) + ascii_table
-
     # 5) Output
     if output_file:
+        # Écriture ligne à ligne : pas de grosse chaîne intermédiaire en mémoire
         with open(output_file, "w", encoding="utf-8") as file_out:
-            file_out.write(final_output)
+            file_out.writelines(
+                ("\n" if i else "") + line for i, line in enumerate(lines)
+            )
+            file_out.write(ascii_table)
         if debug:
             print(f"[DEBUG] Results saved to {output_file}")
     else:
-        print(final_output)
+        print("\n".join(lines) + ascii_table)
 
 
 def main() -> None:
@@ -367,8 +685,8 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Scrape Nom/Région/Email/Groupe/Circonscription + ASCII table."
     )
-    parser.add_argument("--threads", type=int, default=1,
-                        help="Threads à utiliser (1 => séquentiel).")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS,
+                        help=f"Threads à utiliser ({DEFAULT_THREADS} par défaut, 1 => séquentiel).")
     parser.add_argument("--output", type=str,
                         help="Fichier de sortie.")
     parser.add_argument("--debug", action="store_true",
@@ -376,7 +694,7 @@ def main() -> None:
     parser.add_argument("--retries", type=int, default=3,
                         help="Nombre de tentatives par requête (3 par défaut).")
     parser.add_argument("--delay", type=float, default=0.0,
-                        help="Délai (s) entre tentatives (0 par défaut).")
+                        help="Délai (s) de base entre tentatives, doublé à chaque échec (0 par défaut).")
     parser.add_argument("--timeout", type=float, default=10.0,
                         help="Timeout (s) des requêtes (10 par défaut).")
     parser.add_argument("--fields", type=str,
@@ -387,6 +705,8 @@ def main() -> None:
                         help="Sans 'Nom:' ni 'Email:', juste les valeurs.")
     parser.add_argument("--no-separator", action="store_true",
                         help="Si --barefields + 1 champ, retire la ligne de tirets.")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Vide le cache HTTP local et retélécharge toutes les pages.")
 
     args = parser.parse_args()
     use_threads: bool = (args.threads > 1)
@@ -408,7 +728,8 @@ def main() -> None:
         fields=selected_fields,
         use_table=args.table,
         barefields=args.barefields,
-        no_separator=args.no_separator
+        no_separator=args.no_separator,
+        refresh=args.refresh
     )
 
 